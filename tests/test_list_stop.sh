@@ -35,6 +35,43 @@ else
     test_fail "Stats mode should run"
 fi
 
+# The following need Linux /proc (get_process_stats reads /proc/<pid>/stat and status)
+if [ -r /proc/self/stat ]; then
+    # A copy of sleep whose command name contains a space and matches pgrep -f frankenphp
+    fake_bin="$TEST_TMPDIR/fake frankenphp"
+    cp "$(command -v sleep)" "$fake_bin"
+
+    "$fake_bin" 30 &
+    spaced_pid=$!
+    # Child exits immediately; its parent execs into sleep and never reaps it,
+    # leaving a zombie without a VmRSS line in /proc/<pid>/status
+    ( "$fake_bin" 0 & exec sleep 30 ) &
+    zombie_parent=$!
+    sleep 1
+    zombie_pid=$(pgrep -P "$zombie_parent" 2>/dev/null || true)
+
+    output=$("$PHPUP" --stats 2>&1) || true
+
+    test_start "stats mode parses uptime for command names with spaces"
+    uptime=$(printf '%s\n' "$output" | awk -v pid="$spaced_pid" '$1 == pid {print $4}')
+    if [[ "$uptime" =~ ^[0-9]+s$ ]]; then
+        test_pass
+    else
+        test_fail "Expected uptime in seconds for PID $spaced_pid, got '$uptime'"
+    fi
+
+    test_start "stats mode handles processes without VmRSS"
+    memory=$(printf '%s\n' "$output" | awk -v pid="$zombie_pid" '$1 == pid {print $5}')
+    if [ -n "$zombie_pid" ] && assert_equals "$memory" "0MB"; then
+        test_pass
+    else
+        test_fail "Expected 0MB for zombie PID '$zombie_pid', got '$memory'"
+    fi
+
+    kill "$spaced_pid" "$zombie_parent" 2>/dev/null || true
+    wait "$spaced_pid" "$zombie_parent" 2>/dev/null || true
+fi
+
 #
 # Stop mode tests
 #